@@ -11,11 +11,13 @@ from nix_manipulator.expressions.expression import (
     TypedExpression,
     coerce_expression,
 )
+from nix_manipulator.expressions.layout import spaces
 from nix_manipulator.expressions.operator import Operator
 from nix_manipulator.expressions.trivia import (
     collect_comment_trivia_between,
     collect_trailing_comment_trivia,
     gap_line_info,
+    node_text,
     split_inline_comments,
 )
 
@@ -69,7 +71,7 @@ def _ensure_indent(text: str, indent: int) -> str:
         return text
     leading = len(first_line) - len(first_line.lstrip(" "))
     if leading < indent:
-        text = (" " * (indent - leading)) + text
+        text = spaces(indent - leading) + text
     return text
 
 
@@ -344,10 +346,11 @@ class BinaryExpression(TypedExpression):
                 operator_gap_lines = 1
             if comments_before_right and right_gap_lines:
                 right_gap_lines = 1
-            if operator_node.text is None:
+            operator_name = node_text(operator_node)
+            if operator_name is None:
                 raise ValueError("Missing operator")
             operator = Operator(
-                name=operator_node.text.decode(),
+                name=operator_name,
                 before=comments_before_operator,
                 after=operator_after,
             )
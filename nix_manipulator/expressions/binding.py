@@ -13,7 +13,7 @@ from nix_manipulator.expressions.expression import (
     TypedExpression,
     coerce_expression,
 )
-from nix_manipulator.expressions.layout import linebreak
+from nix_manipulator.expressions.layout import linebreak, spaces
 from nix_manipulator.expressions.list import NixList
 from nix_manipulator.expressions.scope import ScopeState
 from nix_manipulator.expressions.trivia import (
@@ -22,6 +22,7 @@ from nix_manipulator.expressions.trivia import (
     format_trivia,
     gap_between,
     layout_from_gap,
+    node_text,
 )
 
 
@@ -164,15 +165,16 @@ class Binding(TypedExpression):
             )
 
         for child in children:
-            if child.type in ("=", ";"):
-                if child.type == "=":
+            child_type = child.type
+            if child_type == "=" or child_type == ";":
+                if child_type == "=":
                     equals_token = child
                 prev_content = child
                 continue
-            elif child.text and child.type == "attrpath":
-                name = child.text.decode()
+            elif child_type == "attrpath" and (attrpath_text := node_text(child)):
+                name = attrpath_text
                 prev_content = child
-            elif child.type == "comment":
+            elif child_type == "comment":
                 comment = Comment.from_cst(child)
                 if (
                     value_node is not None
@@ -256,8 +258,8 @@ class Binding(TypedExpression):
         if self.has_scope():
             return self.rebuild_scoped(indent=indent, inline=inline)
 
-        before_str = format_trivia(self.before, indent=indent)
-        indentation = "" if inline else " " * indent
+        before_str = format_trivia(self.before, indent=indent) if self.before else ""
+        indentation = "" if inline else spaces(indent)
 
         # Decide how the *value* itself has to be rendered
         value_layout = layout_from_gap(self.value_gap)
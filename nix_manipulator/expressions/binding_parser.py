@@ -25,11 +25,12 @@ def parse_binding_sequence(
 
     def parse_item(child: Node, before_trivia: list[Any]) -> Binding | Inherit:
         """Normalize bindings/inherits to avoid invalid members."""
-        if child.type == "binding":
+        child_type = child.type
+        if child_type == "binding":
             return Binding.from_cst(child, before=before_trivia)
-        if child.type in ("inherit", "inherit_from"):
+        if child_type == "inherit" or child_type == "inherit_from":
             return Inherit.from_cst(child, before=before_trivia)
-        raise ValueError(f"Unsupported child node: {child} {child.type}")
+        raise ValueError(f"Unsupported child node: {child} {child_type}")
 
     def can_inline_comment(prev: Node | None, comment_node: Node, items: list) -> bool:
         """Inline only when comments share a line with the preceding item."""
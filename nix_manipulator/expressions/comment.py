@@ -6,6 +6,8 @@ from typing import ClassVar
 from tree_sitter import Node
 
 from nix_manipulator.expressions.expression import TypedExpression
+from nix_manipulator.expressions.layout import spaces
+from nix_manipulator.expressions.trivia import node_text
 
 
 @dataclass(slots=True, repr=False)
@@ -21,18 +23,20 @@ class Comment(TypedExpression):
         if self.shebang:
             return f"#!{self.text}"
         prefix = "# " if self.space_after_hash else "#"
-        lines = self.text.split("\n")
-        rendered = []
-        for line in lines:
-            rendered.append(f"{prefix}{line}" if line else "#")
-        return "\n".join(rendered)
+        text = self.text
+        if "\n" not in text:
+            # Nearly every comment is a single line; skip the split/join.
+            return f"{prefix}{text}" if text else "#"
+        return "\n".join(
+            [f"{prefix}{line}" if line else "#" for line in text.split("\n")]
+        )
 
     @classmethod
     def from_cst(cls, node: Node):
         """Normalize comment syntax so formatting rules stay consistent."""
-        if node.text is None:
+        text = node_text(node)
+        if text is None:
             raise ValueError("Missing comment")
-        text = node.text.decode()
         if text.startswith("/*"):
             doc = text.startswith("/**")
             opener_len = 3 if doc else 2
@@ -84,7 +88,7 @@ class Comment(TypedExpression):
         """Keep indentation stable so comments stay attached to their targets."""
         if self.inline:
             indent = 0
-        return " " * indent + str(self)
+        return spaces(indent) + str(self)
 
 
 @dataclass(slots=True, repr=False)
@@ -99,7 +103,7 @@ class MultilineComment(Comment):
             # Multiline
             result: str
             if self.text.startswith("\n"):
-                result = " " * indent + opening
+                result = spaces(indent) + opening
             else:
                 result = f"{opening} "
             lines = self.text.split("\n")
@@ -107,14 +111,14 @@ class MultilineComment(Comment):
             extra_indent = 2 if self.inner_indent is None else self.inner_indent
             for line in lines[1:]:
                 if line:
-                    result += "\n" + " " * (indent + extra_indent) + line
+                    result += "\n" + spaces(indent + extra_indent) + line
                 else:
                     result += "\n"
 
             if not self.text.endswith("\n"):
                 result += " */"
             else:
-                result += " " * indent + "*/"
+                result += spaces(indent) + "*/"
             return result
         else:
             # Single line
@@ -7,6 +7,7 @@ from typing import Any, ClassVar, Self, cast
 
 from tree_sitter import Node
 
+from nix_manipulator.expressions.layout import spaces
 from nix_manipulator.expressions.scope import Scope, ScopeLayer, ScopeState
 
 try:
@@ -82,6 +83,12 @@ class NixExpression:
         after_str: str | None = None,
     ) -> str:
         """Centralize trivia handling so all nodes format consistently."""
+        if after_str is None and not self.before and not self.after:
+            # Bare leaves (list items, literals) reuse the rendered string as-is.
+            if inline or not indent:
+                return rebuild_string
+            return spaces(indent) + rebuild_string
+
         from nix_manipulator.expressions.trivia import (
             apply_trailing_trivia,
             format_trivia,
@@ -89,7 +96,7 @@ class NixExpression:
         )
 
         before_str = format_trivia(self.before, indent=indent) if self.before else ""
-        indentation = " " * indent if not inline else ""
+        indentation = spaces(indent) if not inline else ""
 
         rebuilt = f"{before_str}{indentation}{rebuild_string}"
 
@@ -104,10 +111,13 @@ class NixExpression:
 
     def has_scope(self) -> bool:
         """Signal scope metadata so rebuild can wrap in lets when needed."""
-        state = cast(ScopeState, self.scope_state)
-        return bool(self.scope) or any(
-            bool(layer.get("scope")) for layer in state.stack
-        )
+        if self.scope:
+            return True
+        # Most nodes carry no layers; skip the generator on the common path.
+        stack = cast(ScopeState, self.scope_state).stack
+        if not stack:
+            return False
+        return any(bool(layer.get("scope")) for layer in stack)
 
     def rebuild_scoped(self, indent: int = 0, inline: bool = False) -> str:
         """Wrap expressions with let-scopes to preserve captured bindings."""
@@ -158,6 +168,10 @@ class NixExpression:
 class TypedExpression(NixExpression):
     """Base class for all Nix objects matching a tree-sitter type."""
 
+    # Without this every slotted subclass would still get a per-instance
+    # __dict__, since one slot-less class in the MRO is enough to add it.
+    __slots__ = ()
+
     tree_sitter_types: ClassVar[set[str]]
 
 
@@ -6,6 +6,7 @@ from typing import ClassVar
 from tree_sitter import Node
 
 from nix_manipulator.expressions.expression import TypedExpression
+from nix_manipulator.expressions.trivia import node_text
 
 
 @dataclass(slots=True, repr=False)
@@ -16,9 +17,10 @@ class FloatExpression(TypedExpression):
     @classmethod
     def from_cst(cls, node: Node):
         """Preserve float token text so round-trip formatting stays identical."""
-        if node.text is None:
+        text = node_text(node)
+        if text is None:
             raise ValueError("Missing expression")
-        return cls(value=node.text.decode())
+        return cls(value=text)
 
     def rebuild(self, indent: int = 0, inline: bool = False) -> str:
         """Reconstruct expression."""
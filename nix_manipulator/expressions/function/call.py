@@ -10,6 +10,7 @@ from tree_sitter import Node
 from nix_manipulator.expressions.comment import Comment
 from nix_manipulator.expressions.expression import NixExpression, TypedExpression
 from nix_manipulator.expressions.identifier import Identifier
+from nix_manipulator.expressions.layout import spaces
 from nix_manipulator.expressions.set import AttributeSet
 from nix_manipulator.expressions.trivia import (
     collect_comments_between_with_gap,
@@ -153,7 +154,7 @@ class FunctionCall(TypedExpression):
                 indent=arg_indent, inline=not prefer_newline
             )
             if prefer_newline and args_str and not args_str[0].isspace():
-                args_str = (" " * arg_indent) + args_str
+                args_str = spaces(arg_indent) + args_str
             sep = "\n" if prefer_newline else " "
         else:
             argument_layout = layout_from_gap(self.argument_gap)
@@ -172,7 +173,7 @@ class FunctionCall(TypedExpression):
                 indent=arg_indent, inline=not argument_layout.on_newline
             )
             if argument_layout.on_newline and args_str and not args_str[0].isspace():
-                args_str = (" " * arg_indent) + args_str
+                args_str = spaces(arg_indent) + args_str
             sep = (
                 "\n\n"
                 if argument_layout.blank_line
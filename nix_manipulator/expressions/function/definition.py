@@ -12,7 +12,7 @@ from nix_manipulator.expressions.comment import Comment
 from nix_manipulator.expressions.ellipses import Ellipses
 from nix_manipulator.expressions.expression import NixExpression, TypedExpression
 from nix_manipulator.expressions.identifier import Identifier
-from nix_manipulator.expressions.layout import comma, empty_line, linebreak
+from nix_manipulator.expressions.layout import comma, empty_line, linebreak, spaces
 from nix_manipulator.expressions.set import AttributeSet
 from nix_manipulator.expressions.trivia import (
     apply_trailing_trivia,
@@ -21,9 +21,12 @@ from nix_manipulator.expressions.trivia import (
     format_trivia,
     gap_between,
     gap_from_offsets,
+    gap_has_empty_line_from_offsets,
     layout_from_gap,
 )
 
+_LEADING_EMPTY_LINE_RE = re.compile(r"[ ]*\n[ ]*\n")
+
 
 def _parse_named_argument_set(node: Node) -> tuple[Identifier | None, bool]:
     """Parse named argument set metadata for function signatures."""
@@ -82,7 +85,6 @@ def _parse_formal_default(
         except StopIteration:
             raise ValueError("Function definition default value is missing") from None
         if default_value_node.type == "comment":
-            gap = gap_between(node, prev_default, default_value_node)
             comment = Comment.from_cst(default_value_node)
             inline_comment = (
                 default_value_node.start_point.row == question_node.start_point.row
@@ -91,7 +93,9 @@ def _parse_formal_default(
                 comment.inline = True
                 default_inline_comments.append(comment)
             else:
-                if re.search(r"\n[ \t]*\n", gap):
+                if gap_has_empty_line_from_offsets(
+                    node, prev_default.end_byte, default_value_node.start_byte
+                ):
                     default_before.append(empty_line)
                 default_before.append(comment)
             prev_default = default_value_node
@@ -158,9 +162,10 @@ def _parse_argument_set(
         if previous_child.type != "{":
             raise ValueError("Function definition formals are missing an opening brace")
         for child in formals_node.children:
-            if child.type in ("{", "}"):
+            child_type = child.type
+            if child_type == "{" or child_type == "}":
                 continue
-            elif child.type == ",":
+            elif child_type == ",":
                 pending_comma_node = None
                 pending_comma_empty_line = False
                 if previous_child:
@@ -168,23 +173,24 @@ def _parse_argument_set(
                     if "\n" in gap:
                         pending_comma_node = child
                         pending_comma_empty_line = bool(
-                            re.match(r"[ ]*\n[ ]*\n[ ]*", gap)
+                            _LEADING_EMPTY_LINE_RE.match(gap)
                         )
                 previous_child = child
                 continue
-            elif child.type == "formal":
+            elif child_type == "formal":
                 if pending_comma_node is not None:
                     flush_pending_comma(child)
                 children = iter(child.children)
                 for grandchild in children:
-                    if grandchild.type == "identifier":
+                    grandchild_type = grandchild.type
+                    if grandchild_type == "identifier":
                         if grandchild.text == b"":
                             # Trailing commas add a "MISSING identifier" element with body b""
                             continue
 
                         if previous_child:
                             gap = gap_between(node, previous_child, child)
-                            if re.match(r"[ ]*\n[ ]*\n[ ]*", gap):
+                            if _LEADING_EMPTY_LINE_RE.match(gap):
                                 before.append(empty_line)
 
                         argument_set.append(
@@ -192,7 +198,7 @@ def _parse_argument_set(
                         )
                         before = []
                         pending_comment_indent = None
-                    elif grandchild.type == "?":
+                    elif grandchild_type == "?":
                         identifier = cast(Identifier, argument_set[-1])
                         _parse_formal_default(
                             node,
@@ -202,21 +208,21 @@ def _parse_argument_set(
                         )
                     else:
                         raise ValueError(
-                            f"Unsupported child node: {grandchild} {grandchild.type}"
+                            f"Unsupported child node: {grandchild} {grandchild_type}"
                         )
-            elif child.type == "ellipses":
+            elif child_type == "ellipses":
                 if pending_comma_node is not None:
                     flush_pending_comma(child)
                 if previous_child:
                     gap = gap_between(node, previous_child, child)
-                    if re.match(r"[ ]*\n[ ]*\n[ ]*", gap):
+                    if _LEADING_EMPTY_LINE_RE.match(gap):
                         before.append(empty_line)
                 ellipses = Ellipses.from_cst(child)
                 ellipses.before = before
                 argument_set.append(ellipses)
                 before = []
                 pending_comment_indent = None
-            elif child.type == "comment":
+            elif child_type == "comment":
                 if pending_comma_node is not None and (
                     child.start_point.row == pending_comma_node.start_point.row
                 ):
@@ -234,7 +240,7 @@ def _parse_argument_set(
                     flush_pending_comma(child)
                 if previous_child:
                     gap = gap_between(node, previous_child, child)
-                    if re.match(r"[ ]*\n[ ]*\n[ ]*", gap):
+                    if _LEADING_EMPTY_LINE_RE.match(gap):
                         before.append(empty_line)
                 comment = Comment.from_cst(child)
                 inline_to_prev = (
@@ -249,11 +255,11 @@ def _parse_argument_set(
                     before.append(comment)
                     if pending_comment_indent is None:
                         pending_comment_indent = child.start_point.column
-            elif child.type == "ERROR" and child.text == b",":
+            elif child_type == "ERROR" and child.text == b",":
                 # Trailing commas are RFC compliant but add a 'ERROR' element..."
                 pass
             else:
-                raise ValueError(f"Unsupported child node: {child} {child.type}")
+                raise ValueError(f"Unsupported child node: {child} {child_type}")
             previous_child = child
 
         closing_brace = next(
@@ -534,7 +540,8 @@ class FunctionDefinition(TypedExpression):
                         inner_str += "\n"
                     inner_str += "\n" * self.argument_set_trailing_empty_lines
                 closing_sep = "" if inner_str.endswith("\n") else "\n"
-                args_str = "{\n" + inner_str + closing_sep + " " * base_indent + "}"
+                closing_indentation = spaces(base_indent)
+                args_str = f"{{\n{inner_str}{closing_sep}{closing_indentation}}}"
             if self.named_attribute_set:
                 if self.named_attribute_set_before_formals:
                     args_str = f"{self.named_attribute_set.rebuild()}@{args_str}"
@@ -610,14 +617,9 @@ class FunctionDefinition(TypedExpression):
 
             if args_multiline:
                 trailing_gap = "\n" * self.argument_set_trailing_empty_lines
-                args_str = (
-                    "{\n"
-                    + "\n".join(args)
-                    + trailing_gap
-                    + "\n"
-                    + " " * base_indent
-                    + "}"
-                )
+                args_body = "\n".join(args)
+                closing_indentation = spaces(base_indent)
+                args_str = f"{{\n{args_body}{trailing_gap}\n{closing_indentation}}}"
             else:
                 args_str = "{ " + ", ".join(args) + " }"
 
@@ -10,7 +10,7 @@ from nix_manipulator.expressions.binding import Binding
 from nix_manipulator.expressions.comment import Comment
 from nix_manipulator.expressions.expression import NixExpression, coerce_expression
 from nix_manipulator.expressions.scope import Scope
-from nix_manipulator.expressions.trivia import trim_leading_layout_trivia
+from nix_manipulator.expressions.trivia import node_text, trim_leading_layout_trivia
 from nix_manipulator.resolution import get_resolution_context, set_resolution_context
 
 
@@ -25,9 +25,9 @@ class Identifier(NixExpression):
     @classmethod
     def from_cst(cls, node: Node, before: list[Any] | None = None):
         """Retain original identifier text for stable symbol references."""
-        if node.text is None:
+        name = node_text(node)
+        if name is None:
             raise ValueError("Identifier has no name")
-        name = node.text.decode()
         return cls(name=name, before=before or [])
 
     def rebuild(
@@ -216,22 +216,21 @@ def _resolve_identifier(
             if index + 1 < total_scopes
             else ()
         )
-        try:
-            binding = scope.get_binding(identifier.name)
+        binding = scope.get_binding(identifier.name, None)
+        if binding is not None:
             return _resolve_binding(binding, scope_chain)
-        except KeyError:
-            quoted_match = next(
-                (
-                    entry
-                    for entry in scope
-                    if isinstance(entry, Binding)
-                    and isinstance(entry.name, str)
-                    and entry.name.strip('"') == identifier.name
-                ),
-                None,
-            )
-            if quoted_match is not None:
-                return _resolve_binding(quoted_match, scope_chain)
+        quoted_match = next(
+            (
+                entry
+                for entry in scope
+                if isinstance(entry, Binding)
+                and isinstance(entry.name, str)
+                and entry.name.strip('"') == identifier.name
+            ),
+            None,
+        )
+        if quoted_match is not None:
+            return _resolve_binding(quoted_match, scope_chain)
 
         for entry in scope:
             if not _inherit_matches(identifier.name, entry):
@@ -6,6 +6,7 @@ from typing import ClassVar
 from tree_sitter import Node
 
 from nix_manipulator.expressions.expression import TypedExpression
+from nix_manipulator.expressions.trivia import node_text
 
 
 def _escape_indented_string(value: str) -> str:
@@ -27,9 +28,9 @@ class IndentedString(TypedExpression):
     @classmethod
     def from_cst(cls, node: Node):
         """Retain indented string payloads to preserve literal formatting."""
-        if node.text is None:
+        text = node_text(node)
+        if text is None:
             raise ValueError("Missing expression")
-        text = node.text.decode()
         if text.startswith("''") and text.endswith("''"):
             value = text[2:-2]
         else:
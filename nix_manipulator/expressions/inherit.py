@@ -10,7 +10,7 @@ from tree_sitter import Node
 from nix_manipulator.expressions.comment import Comment
 from nix_manipulator.expressions.expression import NixExpression, TypedExpression
 from nix_manipulator.expressions.identifier import Identifier
-from nix_manipulator.expressions.layout import empty_line, linebreak
+from nix_manipulator.expressions.layout import empty_line, linebreak, spaces
 from nix_manipulator.expressions.primitive import Primitive
 from nix_manipulator.expressions.trivia import (
     append_comment_between,
@@ -50,16 +50,23 @@ class Inherit(TypedExpression):
         open_paren: Node | None = None
         close_paren: Node | None = None
         last_name_node: Node | None = None
+        semicolon_node: Node | None = None
+        outer_comments: list[Node] = []
 
         for child in node.children:
-            if child.type == "inherit":
+            child_type = child.type
+            if child_type == "inherit":
                 inherit_node = child
-            elif child.type == "inherited_attrs":
+            elif child_type == "inherited_attrs":
                 inherited_attrs = child
-            elif child.type == "(":
+            elif child_type == "(":
                 open_paren = child
-            elif child.type == ")":
+            elif child_type == ")":
                 close_paren = child
+            elif child_type == ";" and semicolon_node is None:
+                semicolon_node = child
+            elif child_type == "comment":
+                outer_comments.append(child)
 
         from_expression: NixExpression | None = None
         from_node = node.child_by_field_name("expression")
@@ -74,9 +81,6 @@ class Inherit(TypedExpression):
         after_names_gap = ""
         parenthesis_open_gap = ""
         parenthesis_close_gap = ""
-        semicolon_node = next(
-            (child for child in node.children if child.type == ";"), None
-        )
 
         if inherited_attrs is not None and inherit_node is not None:
             if (
@@ -92,9 +96,6 @@ class Inherit(TypedExpression):
                 after_inherit_gap = gap_between(node, inherit_node, inherited_attrs)
 
             before_names: list[Any] = []
-            outer_comments = [
-                child for child in node.children if child.type == "comment"
-            ]
             leading_comments = [
                 comment
                 for comment in outer_comments
@@ -240,7 +241,7 @@ class Inherit(TypedExpression):
                     f"{sep}{name_to_render.rebuild(indent=target_indent, inline=False)}"
                 )
             if target_indent:
-                sep += " " * target_indent
+                sep += spaces(target_indent)
             return f"{sep}{name_to_render.rebuild(indent=target_indent, inline=True)}"
 
         def render_names(first_gap: str) -> str:
@@ -306,7 +307,7 @@ class Inherit(TypedExpression):
             if self.from_expression is None:
                 return rebuild_string
             if force_newline:
-                inherit_sep = "\n" + " " * (indent + 2)
+                inherit_sep = "\n" + spaces(indent + 2)
                 from_indent = indent + 2
             else:
                 inherit_sep = separator_from_layout(inherit_layout, indent=indent)
@@ -351,7 +352,7 @@ class Inherit(TypedExpression):
 
         if names_multiline or source_multiline:
             name_indent = indent + 2
-            name_gap = "\n" + " " * name_indent
+            name_gap = "\n" + spaces(name_indent)
 
             force_inherit_newline = source_multiline and not inherit_layout.on_newline
             rebuild_string = render_inherit_source(force_newline=force_inherit_newline)
@@ -361,7 +362,7 @@ class Inherit(TypedExpression):
                 for name in self.names:
                     gap = name_gap
                     if any(item is empty_line for item in name.before):
-                        gap = "\n\n" + " " * name_indent
+                        gap = "\n\n" + spaces(name_indent)
                     chunk = render_name_with_gap(name, gap)
                     rendered_names = (
                         chunk
@@ -370,7 +371,7 @@ class Inherit(TypedExpression):
                     )
                 rebuild_string = append_chunk(rebuild_string, rendered_names)
 
-            semicolon_indent = " " * name_indent
+            semicolon_indent = spaces(name_indent)
             if rebuild_string.endswith("\n"):
                 rebuild_string += f"{semicolon_indent};"
             else:
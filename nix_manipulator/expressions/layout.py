@@ -2,18 +2,24 @@ from __future__ import annotations
 
 
 class EmptyLine:
+    __slots__ = ()
+
     def __repr__(self):
         """Render a stable sentinel name for debugging layout markers."""
         return "EmptyLine"
 
 
 class Linebreak:
+    __slots__ = ()
+
     def __repr__(self):
         """Render a stable sentinel name for debugging layout markers."""
         return "Linebreak"
 
 
 class Comma:
+    __slots__ = ()
+
     def __repr__(self):
         """Render a stable sentinel name for debugging layout markers."""
         return "Comma"
@@ -23,5 +29,16 @@ empty_line = EmptyLine()
 linebreak = Linebreak()
 comma = Comma()
 
+_SPACES_CACHE_SIZE = 128
+# Rebuild asks for the same handful of indent widths on every node.
+_SPACES = tuple(" " * width for width in range(_SPACES_CACHE_SIZE))
+
+
+def spaces(width: int) -> str:
+    """Return *width* spaces, sharing one string per common indent level."""
+    if 0 <= width < _SPACES_CACHE_SIZE:
+        return _SPACES[width]
+    return " " * width
+
 
-__all__ = ["empty_line", "linebreak", "comma"]
+__all__ = ["empty_line", "linebreak", "comma", "spaces"]
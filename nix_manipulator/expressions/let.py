@@ -12,7 +12,7 @@ from nix_manipulator.expressions.binding_parser import parse_binding_sequence
 from nix_manipulator.expressions.comment import Comment
 from nix_manipulator.expressions.expression import NixExpression, TypedExpression
 from nix_manipulator.expressions.inherit import Inherit
-from nix_manipulator.expressions.layout import empty_line, linebreak
+from nix_manipulator.expressions.layout import empty_line, linebreak, spaces
 from nix_manipulator.expressions.scope import ScopeLayer, ScopeState
 from nix_manipulator.expressions.set import _collect_attrpath_order, _render_bindings
 from nix_manipulator.expressions.trivia import (
@@ -52,13 +52,14 @@ class LetExpression(TypedExpression):
         in_symbol: Node | None = None
         binding_set: Node | None = None
         for child in node.children:
-            if child.type == "let":
+            child_type = child.type
+            if child_type == "let":
                 let_symbol = child
-            elif child.type == "in":
+            elif child_type == "in":
                 in_symbol = child
-            elif child.type == "binding_set":
+            elif child_type == "binding_set":
                 binding_set = child
-            elif child.type == "comment":
+            elif child_type == "comment":
                 outer_comments.append(child)
             else:
                 pass
@@ -188,8 +189,8 @@ class LetExpression(TypedExpression):
         """Reconstruct attribute set."""
         indented = indent + 2
 
-        before_str = format_trivia(self.before, indent=indent)
-        after_str = format_trivia(self.after, indent=indent)
+        before_str = format_trivia(self.before, indent=indent) if self.before else ""
+        after_str = format_trivia(self.after, indent=indent) if self.after else ""
         if self.after and isinstance(self.after[0], Comment) and self.after[0].inline:
             if after_str and not after_str.startswith((" ", "\n")):
                 after_str = " " + after_str
@@ -199,7 +200,7 @@ class LetExpression(TypedExpression):
             and after_str.endswith("\n")
         ):
             after_str = after_str[:-1]
-        let_line = " " * indent + "let"
+        let_line = spaces(indent) + "let"
         if self.after_let_comment is not None:
             let_line += f" {self.after_let_comment.rebuild(indent=0)}"
 
@@ -226,7 +227,7 @@ class LetExpression(TypedExpression):
                 f"{before_str}"
                 + let_line
                 + "\n"
-                + " " * indent
+                + spaces(indent)
                 + "in\n"
                 + body_str
                 + f"{after_str}"
@@ -245,7 +246,7 @@ class LetExpression(TypedExpression):
             f"{before_str}"
             + let_line
             + f"\n{bindings_str}{binding_suffix}"
-            + " " * indent
+            + spaces(indent)
             + "in\n"
             + body_str
             + f"{after_str}"
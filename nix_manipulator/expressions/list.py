@@ -13,7 +13,7 @@ from nix_manipulator.expressions.expression import (
     TypedExpression,
     coerce_expression,
 )
-from nix_manipulator.expressions.layout import empty_line
+from nix_manipulator.expressions.layout import empty_line, spaces
 from nix_manipulator.expressions.trivia import (
     apply_trailing_trivia,
     format_trivia,
@@ -28,7 +28,8 @@ def process_list(node: Node):
     """Parse a list node into values and inner trivia."""
     from nix_manipulator.mapping import tree_sitter_node_to_expression
 
-    content_nodes = [child for child in node.children if child.type not in ("[", "]")]
+    # The brackets are the only anonymous children of a list_expression.
+    content_nodes = node.named_children
 
     def parse_item(child: Node, before_trivia: list[Any]) -> NixExpression:
         """Attach leading trivia so list items retain spacing."""
@@ -75,11 +76,8 @@ class NixList(TypedExpression):
     @classmethod
     def from_cst(cls, node: Node):
         """Parse list content while retaining whitespace and comment trivia."""
-        node_text = node.text
-        if node_text is None:
-            raise ValueError("List has no code")
-
-        multiline = b"\n" in node_text
+        # A node spans a newline exactly when it ends on a later row.
+        multiline = node.start_point.row != node.end_point.row
         value, inner_trivia = process_list(node)
         if not value and not inner_trivia:
             opening_bracket = next(
@@ -163,46 +161,48 @@ class NixList(TypedExpression):
         if self.has_scope():
             return self.rebuild_scoped(indent=indent, inline=inline)
 
-        before_str = format_trivia(self.before, indent=indent)
-        multiline = self._auto_multiline(indent=indent, inline=inline)
-        indented = indent + 2 if multiline else indent
-        indentation = "" if inline else " " * indented
+        before_str = format_trivia(self.before, indent=indent) if self.before else ""
 
+        # Empty lists never need the multiline heuristics below.
         if not self.value:
+            closing_indentation = spaces(indent)
+            indentation = "" if inline else closing_indentation
             if self.inner_trivia:
                 inner_str = format_trivia(self.inner_trivia, indent=indent + 2)
                 closing_sep = ""
                 if inner_str:
                     closing_sep = "" if inner_str.endswith("\n") else "\n"
-                indentation = "" if inline else " " * indent
                 list_str = (
-                    f"{before_str}{indentation}[\n{inner_str}{closing_sep}"
-                    + " " * indent
-                    + "]"
+                    f"{before_str}{indentation}[\n"
+                    f"{inner_str}{closing_sep}{closing_indentation}]"
                 )
                 return apply_trailing_trivia(list_str, self.after, indent=indent)
-            indentor = "" if inline else " " * indent
-            list_str = f"{indentor}[ ]"
             return apply_trailing_trivia(
-                f"{before_str}{list_str}", self.after, indent=indent
+                f"{before_str}{indentation}[ ]", self.after, indent=indent
             )
 
-        def render_item(item: NixExpression | str | int | bool | float | None) -> str:
-            """Render list items consistently based on multiline decision."""
-            expr = coerce_expression(item)
-            return expr.rebuild(indent=indented, inline=not multiline)
+        multiline = self._auto_multiline(indent=indent, inline=inline)
+        indented = indent + 2 if multiline else indent
 
-        items = [render_item(item) for item in self.value]
+        # Parsed lists only hold expressions; coerce raw Python values lazily.
+        inline_items = not multiline
+        items = [
+            (
+                item if isinstance(item, NixExpression) else coerce_expression(item)
+            ).rebuild(indent=indented, inline=inline_items)
+            for item in self.value
+        ]
 
         if multiline:
             # Add proper indentation for multiline lists
             items_str = "\n".join(items)
-            indentor = "" if inline else (" " * indent)
+            closing_indentation = spaces(indent)
+            indentor = "" if inline else closing_indentation
             closing_sep = "" if items_str.endswith("\n") else "\n"
-            list_str = indentor + f"[\n{items_str}{closing_sep}" + " " * indent + "]"
+            list_str = f"{indentor}[\n{items_str}{closing_sep}{closing_indentation}]"
         else:
             items_str = " ".join(items)
-            indentor = "" if inline else " " * indent
+            indentor = "" if inline else spaces(indent)
             list_str = f"{indentor}[ {items_str} ]"
 
         return apply_trailing_trivia(
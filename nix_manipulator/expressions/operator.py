@@ -5,6 +5,7 @@ from dataclasses import dataclass
 from tree_sitter import Node
 
 from nix_manipulator.expressions.expression import NixExpression
+from nix_manipulator.expressions.trivia import node_text
 
 
 @dataclass(slots=True, repr=False)
@@ -15,9 +16,10 @@ class Operator(NixExpression):
     @classmethod
     def from_cst(cls, node: Node) -> Operator:
         """Preserve operator tokens to keep spacing and semantics stable."""
-        if node.text is None:
+        name = node_text(node)
+        if name is None:
             raise ValueError("Missing operator")
-        return cls(name=node.text.decode())
+        return cls(name=name)
 
     def rebuild(self, indent: int = 0, inline: bool = False) -> str:
         """Reconstruct expression."""
@@ -9,6 +9,7 @@ from tree_sitter import Node
 
 from nix_manipulator.expressions.comment import Comment
 from nix_manipulator.expressions.expression import NixExpression, TypedExpression
+from nix_manipulator.expressions.layout import spaces
 from nix_manipulator.expressions.trivia import (
     gap_between,
     gap_has_empty_line_from_offsets,
@@ -119,7 +120,7 @@ class Parenthesis(TypedExpression):
             update={"blank_line": self.trailing_blank_line}
         )
         multiline = leading_layout.on_newline or trailing_layout.on_newline
-        indentation = " " * indent if multiline else ("" if inline else " " * indent)
+        indentation = "" if inline and not multiline else spaces(indent)
 
         if multiline:
             if leading_layout.on_newline:
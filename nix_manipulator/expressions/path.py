@@ -9,6 +9,7 @@ from typing import Any, ClassVar
 from tree_sitter import Node
 
 from nix_manipulator.expressions.expression import TypedExpression
+from nix_manipulator.expressions.trivia import node_text
 
 _SOURCE_PATH: ContextVar[Path | None] = ContextVar("nix_source_path", default=None)
 
@@ -41,9 +42,9 @@ class NixPath(TypedExpression):
         after: list[Any] | None = None,
     ):
         """Capture raw path text to keep Nix path semantics intact."""
-        if node.text is None:
+        path = node_text(node)
+        if path is None:
             raise ValueError("Path is missing")
-        path = node.text.decode()
         source_path = _SOURCE_PATH.get()
         return cls(
             path=path,
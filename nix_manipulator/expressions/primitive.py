@@ -163,7 +163,7 @@ class IntegerPrimitive(Primitive):
         return self
 
     def _render_value(self) -> str:
-        return f"{self.value}"
+        return str(self.value)
 
 
 @dataclass(slots=True, eq=False, repr=False)
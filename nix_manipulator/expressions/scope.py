@@ -26,6 +26,9 @@ else:
     ScopeItem = Any  # type: ignore[assignment]
     AttrpathOrderItem = Any  # type: ignore[assignment]
 
+# Lets get_binding() callers probe for a binding without raising KeyError.
+_MISSING: Any = object()
+
 
 class Scope(list[Any]):
     """List-like scope bindings with dict-style access by name."""
@@ -73,15 +76,14 @@ class Scope(list[Any]):
             return value
         return super().__getitem__(key)
 
-    def get_binding(self, key: str):
-        """Return the binding for *key* or raise KeyError if missing."""
+    def get_binding(self, key: str, default: Any = _MISSING):
+        """Return the binding for *key*, else *default* or raise KeyError."""
         index = self._find_binding_index(key)
         if index is None:
-            raise KeyError(key)
-        binding = super().__getitem__(index)
-        from nix_manipulator.expressions.binding import Binding
-
-        return cast(Binding, binding)
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        return cast("Binding", super().__getitem__(index))
 
     def __setitem__(self, key: SupportsIndex | slice | str, value: Any) -> None:
         if isinstance(key, str):
@@ -9,11 +9,13 @@ from tree_sitter import Node
 
 from nix_manipulator.expressions.comment import Comment
 from nix_manipulator.expressions.expression import NixExpression, TypedExpression
+from nix_manipulator.expressions.layout import spaces
 from nix_manipulator.expressions.trivia import (
     collect_comments_between_with_gap,
     format_interstitial_trivia_with_separator,
     format_trivia,
     layout_from_gap,
+    node_text,
 )
 
 
@@ -31,8 +33,6 @@ class Select(TypedExpression):
     @classmethod
     def from_cst(cls, node: Node) -> Select:
         """Capture attrpath/default spacing so selection rebuilds cleanly."""
-        if node.text is None:
-            raise ValueError("Select expression is missing")
         from nix_manipulator.mapping import tree_sitter_node_to_expression
 
         expression_node = node.child_by_field_name("expression")
@@ -41,11 +41,22 @@ class Select(TypedExpression):
 
         if expression_node is None or attrpath_node is None:
             raise ValueError("Select expression is missing required fields")
-        if attrpath_node.text is None:
+        attrpath_text = node_text(attrpath_node)
+        if attrpath_text is None:
             raise ValueError("Select expression attrpath is missing")
 
-        comment_nodes = [child for child in node.children if child.type == "comment"]
-        dot_node = next((child for child in node.children if child.type == "."), None)
+        # One pass over the children finds comments and both separator tokens.
+        comment_nodes: list[Node] = []
+        dot_node: Node | None = None
+        or_node: Node | None = None
+        for child in node.children:
+            child_type = child.type
+            if child_type == "comment":
+                comment_nodes.append(child)
+            elif child_type == "." and dot_node is None:
+                dot_node = child
+            elif child_type == "or" and or_node is None:
+                or_node = child
         attr_gap = ""
         attr_before: list[Any] = []
         if dot_node is not None:
@@ -60,9 +71,6 @@ class Select(TypedExpression):
         default_gap = " "
         default_before: list[Any] = []
         if default_node is not None:
-            or_node = next(
-                (child for child in node.children if child.type == "or"), None
-            )
             boundary_node = or_node if or_node is not None else default_node
             if boundary_node is not None:
                 default_before, default_gap = collect_comments_between_with_gap(
@@ -74,7 +82,7 @@ class Select(TypedExpression):
                 )
         return cls(
             expression=tree_sitter_node_to_expression(expression_node),
-            attribute=attrpath_node.text.decode(),
+            attribute=attrpath_text,
             default=(
                 tree_sitter_node_to_expression(default_node)
                 if default_node is not None
@@ -134,7 +142,7 @@ class Select(TypedExpression):
                     if default_before
                     else ""
                 )
-                or_indent = " " * default_indent if default_indent else ""
+                or_indent = spaces(default_indent) if default_indent else ""
                 if comment_str:
                     if not comment_str.endswith("\n"):
                         comment_str += "\n"
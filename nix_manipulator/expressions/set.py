@@ -13,7 +13,7 @@ from nix_manipulator.expressions.binding_parser import parse_binding_sequence
 from nix_manipulator.expressions.expression import NixExpression, TypedExpression
 from nix_manipulator.expressions.identifier import Identifier
 from nix_manipulator.expressions.inherit import Inherit
-from nix_manipulator.expressions.layout import empty_line
+from nix_manipulator.expressions.layout import empty_line, spaces
 from nix_manipulator.expressions.scope import Scope
 from nix_manipulator.expressions.trivia import (
     apply_trailing_trivia,
@@ -338,36 +338,36 @@ class AttributeSet(TypedExpression):
 
         if not self.values:
             if self.inner_trivia:
-                before_str = format_trivia(self.before, indent=indent)
+                before_str = (
+                    format_trivia(self.before, indent=indent) if self.before else ""
+                )
                 inner_str = format_trivia(self.inner_trivia, indent=indent + 2)
                 closing_sep = ""
                 if inner_str:
                     closing_sep = "" if inner_str.endswith("\n") else "\n"
-                indentation = "" if inline else " " * indent
+                closing_indentation = spaces(indent)
+                indentation = "" if inline else closing_indentation
                 set_str = (
-                    f"{before_str}{indentation}{prefix}{{\n{inner_str}{closing_sep}"
-                    + " " * indent
-                    + "}"
+                    f"{before_str}{indentation}{prefix}{{\n"
+                    f"{inner_str}{closing_sep}{closing_indentation}}}"
                 )
                 return apply_trailing_trivia(set_str, self.after, indent=indent)
             return self.add_trivia(f"{prefix}{{ }}", indent=indent, inline=inline)
 
         if self.multiline:
-            before_str = format_trivia(self.before, indent=indent)
+            before_str = (
+                format_trivia(self.before, indent=indent) if self.before else ""
+            )
             render_values = self.attrpath_order if self.attrpath_order else self.values
             bindings_str = "\n".join(
                 _render_bindings(render_values, indent=indented, inline=False)
             )
-            if bindings_str.endswith("\n"):
-                closing_sep = ""
-            else:
-                closing_sep = "\n"
-            indentation = "" if inline else " " * indent
+            closing_sep = "" if bindings_str.endswith("\n") else "\n"
+            indentation = "" if inline else spaces(indent)
+            closing_indentation = spaces(indent)
             set_str = (
-                f"{before_str}{indentation}{prefix}{{"
-                + f"\n{bindings_str}{closing_sep}"
-                + " " * indent
-                + "}"
+                f"{before_str}{indentation}{prefix}{{\n"
+                f"{bindings_str}{closing_sep}{closing_indentation}}}"
             )
             return apply_trailing_trivia(set_str, self.after, indent=indent)
         else:
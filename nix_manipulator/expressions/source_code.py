@@ -46,6 +46,8 @@ except ImportError:
 class NixSourceCode:
     """Represent a whole Nix file as a sequence of expressions and trivia."""
 
+    __slots__ = ("contains_error", "expressions", "node", "source_path", "trailing")
+
     tree_sitter_types: ClassVar[set[str]] = {"source_code"}
     node: Node
     expressions: list[Any]
@@ -81,14 +83,15 @@ class NixSourceCode:
         if has_error_attr is not None:
             contains_error = node.has_error
         else:
-
-            def has_error(cur: Node) -> bool:
-                """Scan CST nodes to decide when to preserve raw text."""
+            # Scan with an explicit stack so deeply nested sources cannot hit
+            # the interpreter recursion limit.
+            pending = [node]
+            while pending:
+                cur = pending.pop()
                 if cur.type == "ERROR":
-                    return True
-                return any(has_error(child) for child in cur.children)
-
-            contains_error = has_error(node)
+                    contains_error = True
+                    break
+                pending.extend(cur.children)
 
         if contains_error:
             # Preserve the raw text so round-tripping doesn't lose information.
@@ -100,7 +103,7 @@ class NixSourceCode:
                 contains_error=True,
             )
 
-        with source_bytes_context(source_bytes):
+        with source_bytes_context(source_bytes, base=node.start_byte):
             children = node.children
             leading_trivia: list[Any] = []
             if children:
@@ -157,7 +160,7 @@ class NixSourceCode:
 
     def rebuild(self) -> str:
         """Reassemble source with trailing trivia to keep file structure."""
-        rebuilt = "".join(obj.rebuild() for obj in self.expressions)
+        rebuilt = "".join([obj.rebuild() for obj in self.expressions])
         if not self.trailing:
             return rebuilt
 
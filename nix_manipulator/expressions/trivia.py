@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+import sys
 from contextlib import contextmanager
 from contextvars import ContextVar
 from copy import copy
@@ -11,23 +12,60 @@ from typing import Any, Callable, Iterable
 
 from tree_sitter import Node
 
-from nix_manipulator.expressions.layout import comma, empty_line, linebreak
+from nix_manipulator.expressions.layout import comma, empty_line, linebreak, spaces
 
 _EMPTY_LINE_RE = re.compile(r"\n[ \t]*\n")
 _GAP_WHITESPACE_BYTES = (32, 9)
+# Short gaps ("\n  ", " = ", ...) repeat thousands of times in large files;
+# interning lets nodes that keep them share one string object.
+_INTERN_GAP_MAX_LEN = 16
 _SOURCE_BYTES: ContextVar[bytes | None] = ContextVar("nix_source_bytes", default=None)
+_SOURCE_TEXT: ContextVar[str | None] = ContextVar("nix_source_text", default=None)
+_SOURCE_BASE: ContextVar[int] = ContextVar("nix_source_base", default=0)
 
 
 @contextmanager
-def source_bytes_context(source_bytes: bytes | None):
-    """Share source bytes to avoid repeated decoding across trivia helpers."""
+def source_bytes_context(source_bytes: bytes | None, base: int = 0):
+    """Share source bytes to avoid repeated decoding across trivia helpers.
+
+    ``base`` is the absolute offset of ``source_bytes[0]`` so ``node_text``
+    can slice exact node spans; the root node's text starts at its first
+    token, not at byte zero of the file.
+    """
+    # ASCII sources have identical byte and character offsets, so one decode
+    # lets every node slice its text straight from the shared string.
+    source_text = (
+        source_bytes.decode()
+        if source_bytes is not None and source_bytes.isascii()
+        else None
+    )
     token = _SOURCE_BYTES.set(source_bytes)
+    text_token = _SOURCE_TEXT.set(source_text)
+    base_token = _SOURCE_BASE.set(base)
     try:
         yield
     finally:
+        _SOURCE_BASE.reset(base_token)
+        _SOURCE_TEXT.reset(text_token)
         _SOURCE_BYTES.reset(token)
 
 
+def node_text(node: Node) -> str | None:
+    """Return a node's source text, slicing the shared source when available."""
+    base = _SOURCE_BASE.get()
+    start = node.start_byte - base
+    end = node.end_byte - base
+    if start >= 0:
+        source_text = _SOURCE_TEXT.get()
+        if source_text is not None:
+            return source_text[start:end]
+        source_bytes = _SOURCE_BYTES.get()
+        if source_bytes is not None:
+            return source_bytes[start:end].decode()
+    text = node.text
+    return text.decode() if text is not None else None
+
+
 def _gap_span(
     parent: Node, start_byte: int, end_byte: int
 ) -> tuple[bytes, int, int] | None:
@@ -36,7 +74,12 @@ def _gap_span(
         return None
     source_bytes = _SOURCE_BYTES.get()
     if source_bytes is not None:
-        return source_bytes, start_byte, end_byte
+        # Same offset rule as node_text: the shared buffer starts at base.
+        base = _SOURCE_BASE.get()
+        start = start_byte - base
+        end = end_byte - base
+        if start >= 0 and end >= 0:
+            return source_bytes, start, end
     if parent.text is None:
         return None
     base = parent.start_byte
@@ -127,7 +170,7 @@ def separator_from_layout(layout: Layout, *, indent: int, inline_sep: str = " ")
     sep = "\n\n" if layout.blank_line else "\n"
     target_indent = layout.indent if layout.indent is not None else indent
     if target_indent:
-        sep += " " * target_indent
+        sep += spaces(target_indent)
     return sep
 
 
@@ -144,7 +187,7 @@ def separator_from_layout_with_comments(
         if layout.blank_line:
             sep += "\n"
         if include_indent and layout.indent:
-            sep += " " * layout.indent
+            sep += spaces(layout.indent)
         return sep
     if comment_str:
         return "" if comment_str.endswith((" ", "\n")) else inline_sep
@@ -156,11 +199,11 @@ def format_trivia(trivia_list: list[Any], indent: int = 0) -> str:
     if not trivia_list:
         return ""
     from nix_manipulator.expressions.assertion import Assertion
-    from nix_manipulator.expressions.comment import Comment, MultilineComment
+    from nix_manipulator.expressions.comment import Comment
 
     parts: list[str] = []
     ends_with_newline = True
-    indent_str = " " * indent if indent else ""
+    indent_str = spaces(indent)
     for index, item in enumerate(trivia_list):
         if item is empty_line:
             parts.append("\n")
@@ -181,7 +224,7 @@ def format_trivia(trivia_list: list[Any], indent: int = 0) -> str:
             elif next_item is linebreak or next_item is None:
                 parts.append("\n")
                 ends_with_newline = True
-        elif isinstance(item, (Comment, MultilineComment, Assertion)):
+        elif isinstance(item, (Comment, Assertion)):
             parts.append(item.rebuild(indent=indent))
             parts.append("\n")
             ends_with_newline = True
@@ -197,29 +240,39 @@ def format_interstitial_trivia(
     inline_comment_newline: bool = False,
 ) -> str:
     """Render interstitial trivia, optionally forcing inline comments onto newlines."""
-    rendered = ""
+    parts: list[str] = []
+    append = parts.append
+    # Last character emitted so far ("" while empty); stands in for the
+    # endswith() checks a growing string would need.
+    tail = ""
     for item in items:
         if item is empty_line:
-            if not rendered.endswith("\n"):
-                rendered += "\n"
-            rendered += "\n"
+            if tail != "\n":
+                append("\n")
+            append("\n")
+            tail = "\n"
         elif item is linebreak:
-            if not rendered.endswith("\n"):
-                rendered += "\n"
+            if tail != "\n":
+                append("\n")
+                tail = "\n"
+        elif getattr(item, "inline", False):
+            if tail != " " and tail != "\n":
+                append(" ")
+                tail = " "
+            text = item.rebuild(indent=0)
+            if text:
+                append(text)
+                tail = text[-1]
+            if inline_comment_newline:
+                append("\n")
+                tail = "\n"
         else:
-            if getattr(item, "inline", False):
-                if rendered and not rendered.endswith((" ", "\n")):
-                    rendered += " "
-                elif not rendered:
-                    rendered += " "
-                rendered += item.rebuild(indent=0)
-                if inline_comment_newline:
-                    rendered += "\n"
-            else:
-                if rendered and not rendered.endswith("\n"):
-                    rendered += "\n"
-                rendered += item.rebuild(indent=indent) + "\n"
-    return rendered
+            if tail and tail != "\n":
+                append("\n")
+            append(item.rebuild(indent=indent))
+            append("\n")
+            tail = "\n"
+    return "".join(parts)
 
 
 def format_interstitial_trivia_with_separator(
@@ -446,6 +499,9 @@ def collect_comments_between_with_gap(
     allow_inline: bool = False,
 ) -> tuple[list[Any], str]:
     """Collect comments between nodes and return trailing gap text."""
+    if isinstance(comments, (list, tuple)) and not comments:
+        # Most gaps carry no comments; skip selection and trivia building.
+        return [], gap_between(parent, start, end)
     collected, selected = _collect_comment_trivia_between(
         parent,
         comments,
@@ -479,27 +535,29 @@ def parse_delimited_sequence(
     before: list[Any] = list(initial_trivia) if initial_trivia else []
     inner_trivia: list[Any] = []
 
-    def push_gap(prev: Node | None, cur: Node) -> None:
-        """Capture spacing between sequence items for later trivia attachment."""
-        if prev is None:
-            return
-        append_gap_between_offsets(before, parent, prev, cur)
-
-    if content_nodes and open_token is not None:
-        opening = next(
-            (child for child in parent.children if child.type == open_token), None
-        )
-        if opening is not None:
-            if gap_has_empty_line_from_offsets(
-                parent, opening.end_byte, content_nodes[0].start_byte
-            ):
-                before.append(empty_line)
+    opening: Node | None = None
+    closing: Node | None = None
+    if content_nodes and (open_token is not None or close_token is not None):
+        # Locate both delimiters in one scan of the parent's children.
+        for child in parent.children:
+            child_type = child.type
+            if opening is None and child_type == open_token:
+                opening = child
+            elif closing is None and child_type == close_token:
+                closing = child
+
+    if opening is not None:
+        if gap_has_empty_line_from_offsets(
+            parent, opening.end_byte, content_nodes[0].start_byte
+        ):
+            before.append(empty_line)
 
     prev_content: Node | None = None
     for child in content_nodes:
         if child.type == "comment":
             if can_inline_comment(prev_content, child, items):
-                push_gap(prev_content, child)
+                if prev_content is not None:
+                    append_gap_between_offsets(before, parent, prev_content, child)
                 comment_expr = Comment.from_cst(child)
                 comment_expr.inline = True
                 attach_inline_comment(items[-1], comment_expr)
@@ -508,7 +566,8 @@ def parse_delimited_sequence(
             prev_content = child
             continue
 
-        push_gap(prev_content, child)
+        if prev_content is not None:
+            append_gap_between_offsets(before, parent, prev_content, child)
         item = parse_item(child, before)
         if item is not None:
             items.append(item)
@@ -521,18 +580,14 @@ def parse_delimited_sequence(
         else:
             inner_trivia = before
 
-    if content_nodes and close_token is not None:
-        closing = next(
-            (child for child in parent.children if child.type == close_token), None
-        )
-        if closing is not None:
-            if gap_has_empty_line_from_offsets(
-                parent, content_nodes[-1].end_byte, closing.start_byte
-            ):
-                if items:
-                    items[-1].after.append(empty_line)
-                else:
-                    inner_trivia.append(empty_line)
+    if closing is not None:
+        if gap_has_empty_line_from_offsets(
+            parent, content_nodes[-1].end_byte, closing.start_byte
+        ):
+            if items:
+                items[-1].after.append(empty_line)
+            else:
+                inner_trivia.append(empty_line)
 
     return items, inner_trivia
 
@@ -545,7 +600,12 @@ def gap_from_offsets(parent: Node, start_byte: int, end_byte: int) -> str:
     if span is None:
         return ""
     source_bytes, start, end = span
-    return source_bytes[start:end].decode()
+    source_text = _SOURCE_TEXT.get()
+    if source_text is not None and source_bytes is _SOURCE_BYTES.get():
+        gap = source_text[start:end]
+    else:
+        gap = source_bytes[start:end].decode()
+    return sys.intern(gap) if len(gap) <= _INTERN_GAP_MAX_LEN else gap
 
 
 def gap_between(parent: Node, start: Node, end: Node) -> str:
@@ -673,10 +733,10 @@ def apply_trailing_trivia(rebuilt: str, after: list[Any], *, indent: int) -> str
     This mirrors NixExpression.add_trivia's inline-comment handling, but it
     assumes *rebuilt* already includes any leading trivia/indentation.
     """
-    from nix_manipulator.expressions.comment import Comment
-
     if not after:
         return rebuilt
+    from nix_manipulator.expressions.comment import Comment
+
     if isinstance(after[0], Comment) and after[0].inline:
         inline_comment = after[0].rebuild(indent=0)
         trailing = format_trivia(after[1:], indent=indent)
@@ -11,12 +11,13 @@ from nix_manipulator.expressions.expression import (
     TypedExpression,
     coerce_expression,
 )
-from nix_manipulator.expressions.layout import empty_line, linebreak
+from nix_manipulator.expressions.layout import empty_line, linebreak, spaces
 from nix_manipulator.expressions.trivia import (
     collect_comment_trivia_between,
     format_interstitial_trivia_with_separator,
     gap_between,
     layout_from_gap,
+    node_text,
 )
 
 
@@ -46,9 +47,9 @@ class UnaryExpression(TypedExpression):
         if len(content_nodes) < 2:
             raise ValueError("Unary expression is incomplete")
         operator_node, expression_node = content_nodes[0], content_nodes[1]
-        if operator_node.text is None:
+        operator = node_text(operator_node)
+        if operator is None:
             raise ValueError("Unary operator missing")
-        operator = operator_node.text.decode()
         expression = tree_sitter_node_to_expression(expression_node)
 
         comment_nodes = [
@@ -119,7 +120,7 @@ class UnaryExpression(TypedExpression):
             drop_blank_line_if_items=False,
         )
 
-        indentation = "" if inline else " " * indent
+        indentation = "" if inline else spaces(indent)
         if self.operator == "++" and not inline:
             base = f"\n{indentation}{self.operator}"
         else:
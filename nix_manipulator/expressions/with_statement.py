@@ -10,7 +10,7 @@ from tree_sitter import Node
 from nix_manipulator.expressions.comment import Comment
 from nix_manipulator.expressions.expression import NixExpression, TypedExpression
 from nix_manipulator.expressions.indented_string import IndentedString
-from nix_manipulator.expressions.layout import empty_line, linebreak
+from nix_manipulator.expressions.layout import empty_line, linebreak, spaces
 from nix_manipulator.expressions.list import NixList
 from nix_manipulator.expressions.parenthesis import Parenthesis
 from nix_manipulator.expressions.set import AttributeSet
@@ -23,6 +23,7 @@ from nix_manipulator.expressions.trivia import (
     split_inline_comments,
     trim_leading_layout_trivia,
 )
+from nix_manipulator.resolution import attach_resolution_context
 
 
 @dataclass(slots=True, repr=False)
@@ -42,9 +43,15 @@ class WithStatement(TypedExpression):
 
         environment_node = node.child_by_field_name("environment")
         body_node = node.child_by_field_name("body")
-        with_node = next(
-            (child for child in node.children if child.type == "with"), None
-        )
+        # One pass over the children finds both the keyword and any comments.
+        with_node: Node | None = None
+        comment_nodes: list[Node] = []
+        for child in node.children:
+            child_type = child.type
+            if child_type == "comment":
+                comment_nodes.append(child)
+            elif child_type == "with" and with_node is None:
+                with_node = child
         from nix_manipulator.mapping import tree_sitter_node_to_expression
 
         environment = tree_sitter_node_to_expression(environment_node)
@@ -53,7 +60,6 @@ class WithStatement(TypedExpression):
         after_with_comments: list[Any] = []
         after_with_gap: str = " "
         after_semicolon_comments: list[Any] = []
-        comment_nodes = [child for child in node.children if child.type == "comment"]
 
         if with_node is not None and environment_node is not None:
             after_with_comments, after_with_gap = collect_comments_between_with_gap(
@@ -171,7 +177,7 @@ class WithStatement(TypedExpression):
             body_str = self.body.rebuild(indent=indent, inline=False)
             body_sep = " "
             if body_sep == " " and indent:
-                indent_prefix = " " * indent
+                indent_prefix = spaces(indent)
                 if body_str.startswith(indent_prefix):
                     body_str = body_str[len(indent_prefix) :]
         else:
@@ -195,8 +201,6 @@ class WithStatement(TypedExpression):
 
     def _attach_body_context(self) -> NixExpression:
         """Ensure the body carries the with-environment scope."""
-        from nix_manipulator.resolution import attach_resolution_context
-
         attach_resolution_context(self.body, owner=self)
         return self.body
 
@@ -65,14 +65,15 @@ def register_expression(cls: type[TypedExpression]) -> type[TypedExpression]:
 
 def tree_sitter_node_to_expression(node) -> NixExpression:
     """Centralize CST-to-expression mapping to keep parsing rules consistent."""
-    if node.type == "let_expression":
+    node_type = node.type
+    if node_type == "let_expression":
         return parse_let_expression(node)
-    if node.type == "apply_expression":
+    if node_type == "apply_expression":
         # `import` is modeled as its own expression for clear semantics.
         if Import.is_import_node(node):
             return Import.from_cst(node)
         return FunctionCall.from_cst(node)
-    expression_type = TREE_SITTER_TYPE_TO_EXPRESSION.get(node.type)
+    expression_type = TREE_SITTER_TYPE_TO_EXPRESSION.get(node_type)
     if expression_type is None:
-        raise ValueError(f"Unsupported node type: {node.type}")
+        raise ValueError(f"Unsupported node type: {node_type}")
     return expression_type.from_cst(node)
@@ -8,13 +8,16 @@ from tree_sitter import Language, Node, Parser
 from nix_manipulator.expressions.path import source_path_context
 from nix_manipulator.expressions.source_code import NixSourceCode
 
+# Bind a private prototype once instead of mutating the shared
+# ctypes.pythonapi.PyCapsule_New signature on every call.
+_PYCAPSULE_NEW = ctypes.PYFUNCTYPE(
+    ctypes.py_object, ctypes.c_void_p, ctypes.c_char_p, ctypes.c_void_p
+)(("PyCapsule_New", ctypes.pythonapi))
+
 
 def _capsule_from_pointer(ptr: int) -> object:
     """Wrap legacy pointer bindings so newer tree-sitter avoids deprecated int paths."""
-    pycapsule_new = ctypes.pythonapi.PyCapsule_New
-    pycapsule_new.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_void_p]
-    pycapsule_new.restype = ctypes.py_object
-    return pycapsule_new(ctypes.c_void_p(ptr), b"tree_sitter.Language", None)
+    return _PYCAPSULE_NEW(ctypes.c_void_p(ptr), b"tree_sitter.Language", None)
 
 
 def _load_language() -> Language:
@@ -65,7 +68,16 @@ def parse(
 def parse_file(path: Path | str) -> NixSourceCode:
     """Parse a Nix file from disk with UTF-8 decoding."""
     path = Path(path)
-    source_code = path.read_text(encoding="utf-8")
+    source_bytes = path.read_bytes()
+    source_code: bytes | str
+    if source_bytes.isascii() and b"\r" not in source_bytes:
+        # Text mode would decode and parse() re-encode identical bytes.
+        source_code = source_bytes
+    else:
+        # Match read_text(): strict UTF-8 and universal newlines.
+        source_code = (
+            source_bytes.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+        )
     with source_path_context(path):
         source = parse(source_code, source_path=path)
     return source
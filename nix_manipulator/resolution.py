@@ -2,39 +2,61 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Iterable, Sequence
-from weakref import ReferenceType, ref
+from typing import TYPE_CHECKING, Any, Iterable, NamedTuple, Sequence
+from weakref import KeyedRef, ReferenceType
 
 from nix_manipulator.exceptions import ResolutionError
 from nix_manipulator.expressions.expression import NixExpression
-from nix_manipulator.expressions.scope import Scope, ScopeLayer
+from nix_manipulator.expressions.scope import Scope, ScopeLayer, ScopeState
 
+if TYPE_CHECKING:
+    from nix_manipulator.expressions.function.call import FunctionCall
+    from nix_manipulator.expressions.set import AttributeSet
 
-@dataclass(slots=True)
-class ResolutionContext:
+
+class ResolutionContext(NamedTuple):
     """Store the ordered scope chain for resolving identifiers."""
 
+    # One is built per attached expression; a tuple is cheaper to construct
+    # than a slotted dataclass and still exposes ``.scopes``.
     scopes: tuple[Scope, ...]
 
 
 _CONTEXTS: dict[int, tuple[ReferenceType[NixExpression], ResolutionContext]] = {}
 
 
+def _evict_context(reference: KeyedRef) -> None:
+    """Drop the entry owned by *reference* once its expression is collected."""
+
+    existing = _CONTEXTS.get(reference.key)
+    if existing is not None and existing[0] is reference:
+        _CONTEXTS.pop(reference.key, None)
+
+
 def _store_context(expr: NixExpression, context: ResolutionContext) -> None:
     """Persist *context* for *expr* and clean up automatically on GC."""
 
+    # Expressions compare by value, so a WeakKeyDictionary would merge equal
+    # nodes; key by id and let a KeyedRef carry the id to the shared callback.
     expr_id = id(expr)
+    existing = _CONTEXTS.get(expr_id)
+    reference: ReferenceType[NixExpression]
+    if existing is not None and existing[0]() is expr:
+        reference = existing[0]
+    else:
+        reference = KeyedRef(expr, _evict_context, expr_id)
+    _CONTEXTS[expr_id] = (reference, context)
 
-    def _clear(reference: ReferenceType[NixExpression]) -> None:
-        existing = _CONTEXTS.get(expr_id)
-        if existing is None:
-            return
-        stored_ref, _ = existing
-        if stored_ref is reference:
-            _CONTEXTS.pop(expr_id, None)
 
-    _CONTEXTS[expr_id] = (ref(expr, _clear), context)
+def _store_scopes(expr: NixExpression, scopes: tuple[Scope, ...]) -> None:
+    """Store *scopes* for *expr*, keeping its context when the chain is shared."""
+
+    # scopes_for_owner hands back the inherited tuple itself for plain owners,
+    # so siblings re-attached under one owner usually see the same chain.
+    existing = _CONTEXTS.get(id(expr))
+    if existing is not None and existing[1].scopes is scopes and existing[0]() is expr:
+        return
+    _store_context(expr, ResolutionContext(scopes))
 
 
 def _get_context(expr: NixExpression) -> ResolutionContext | None:
@@ -63,141 +85,155 @@ def _as_scope(
 def _collect_scopes_from_layers(
     layers: Sequence[ScopeLayer], *, owner: NixExpression | None = None
 ) -> list[Scope]:
-    collected: list[Scope] = []
-    for layer in layers:
-        scope_value = layer.get("scope", [])
-        collected.append(_as_scope(scope_value, owner=owner))
-    return collected
+    """Wrap each non-empty layer scope, reading every layer exactly once."""
+    return [
+        _as_scope(scope_value, owner=owner)
+        for layer in layers
+        if (scope_value := layer.get("scope"))
+    ]
 
 
 def scopes_for_owner(owner: NixExpression) -> tuple[Scope, ...]:
     """Build a scope chain from an owner expression and inherited context (internal helper, not a stable public API)."""
+    from nix_manipulator.expressions.function.call import FunctionCall
+    from nix_manipulator.expressions.identifier import Identifier
+    from nix_manipulator.expressions.set import AttributeSet
+    from nix_manipulator.expressions.with_statement import WithStatement
+
     inherited = _get_context(owner)
-    inherited_scopes: tuple[Scope, ...] = ()
-    scopes: list[Scope] = []
-    if inherited is not None:
-        inherited_scopes = inherited.scopes
-        scopes.extend(inherited_scopes)
+    inherited_scopes: tuple[Scope, ...] = (
+        inherited.scopes if inherited is not None else ()
+    )
 
     owner_scopes: list[Scope] = []
-    owner_state = getattr(owner, "scope_state", None)
-    if getattr(owner, "scope", None) is not None and owner.scope:
-        scope_value = _as_scope(owner.scope, owner=owner)
-        owner_scopes.append(scope_value)
+    # Every NixExpression declares scope and scope_state, so read them directly.
+    owner_scope = owner.scope
+    if owner_scope:
+        # __post_init__ already wraps and owns the scope; skip the call then.
+        if type(owner_scope) is not Scope or owner_scope.owner is not owner:
+            owner_scope = _as_scope(owner_scope, owner=owner)
+        owner_scopes.append(owner_scope)
+    owner_state = owner.scope_state
+    if isinstance(owner_state, dict):
+        owner_state = ScopeState(**owner_state)
+        owner.scope_state = owner_state
     if owner_state is not None and owner_state.stack:
-        for layer_scope in _collect_scopes_from_layers(
-            [layer for layer in owner_state.stack if layer.get("scope")], owner=owner
-        ):
-            owner_scopes.append(layer_scope)
-
-    if owner_scopes:
-        scopes.extend(owner_scopes)
-
-    def _scope_from_attrset(attrset: Any, *, base: tuple[Scope, ...]) -> Scope:
-        """Normalize attribute sets into scopes and attach inherited context."""
-        scope_value = _as_scope(getattr(attrset, "values", ()), owner=attrset)
-        if base:
-            set_resolution_context(attrset, base)
-        return scope_value
-
-    from nix_manipulator.expressions.set import AttributeSet  # type: ignore
-
-    if isinstance(owner, AttributeSet) and owner.recursive:
-        scopes.append(_scope_from_attrset(owner, base=tuple(scopes)))
-
-    from nix_manipulator.expressions.identifier import Identifier  # type: ignore
-    from nix_manipulator.expressions.with_statement import WithStatement  # type: ignore
-
-    if isinstance(owner, WithStatement):
-        env_scope: Scope | None = None
+        owner_scopes.extend(_collect_scopes_from_layers(owner_state.stack, owner=owner))
+
+    recursive_set = (
+        owner if isinstance(owner, AttributeSet) and owner.recursive else None
+    )
+    if not (
+        owner_scopes
+        or recursive_set is not None
+        or isinstance(owner, (WithStatement, FunctionCall))
+    ):
+        # Plain owners add nothing; share the inherited tuple without copying.
+        return inherited_scopes
+
+    # Owner kinds are exclusive, so at most one scope is added on top of this
+    # chain; every branch shares the one tuple instead of re-snapshotting.
+    base = (*inherited_scopes, *owner_scopes)
+    extra: Scope | None = None
+    if recursive_set is not None:
+        extra = _scope_from_attrset(recursive_set, base=base)
+    elif isinstance(owner, WithStatement):
         environment = owner.environment
         if isinstance(environment, AttributeSet):
-            env_scope = _scope_from_attrset(environment, base=tuple(scopes))
+            extra = _scope_from_attrset(environment, base=base)
         elif isinstance(environment, Identifier):
-            context_scopes = tuple(scopes) if scopes else inherited_scopes
-            if context_scopes:
-                set_resolution_context(environment, context_scopes)
+            if base:
+                set_resolution_context(environment, base)
                 resolved_env = environment.value
                 if isinstance(resolved_env, AttributeSet):
-                    env_scope = _scope_from_attrset(resolved_env, base=tuple(scopes))
+                    extra = _scope_from_attrset(resolved_env, base=base)
                 else:
                     raise ResolutionError(
                         "with environment must resolve to an attribute set"
                     )
         elif isinstance(environment, Scope):
-            env_scope = environment
+            extra = environment
         else:
             raise ResolutionError("with environment must resolve to an attribute set")
-        if env_scope is not None:
-            scopes.append(env_scope)
+    elif isinstance(owner, FunctionCall):
+        # base already holds the call's own layers; skip re-collecting them.
+        extra = _call_parameter_scope(owner, base)
+
+    return base if extra is None else (*base, extra)
+
+
+def _scope_from_attrset(attrset: AttributeSet, *, base: tuple[Scope, ...]) -> Scope:
+    """Normalize attribute sets into scopes and attach inherited context."""
+    scope_value = _as_scope(attrset.values, owner=attrset)
+    if base:
+        set_resolution_context(attrset, base)
+    return scope_value
+
 
-    from nix_manipulator.expressions.function.call import FunctionCall  # type: ignore
+def _resolve_argument_to_attrset(
+    argument: Any, *, scope_chain: tuple[Scope, ...]
+) -> AttributeSet:
+    """Accept identifiers/parentheses that resolve to attrsets."""
+    from nix_manipulator.expressions.identifier import Identifier
+    from nix_manipulator.expressions.parenthesis import Parenthesis
+    from nix_manipulator.expressions.set import AttributeSet
 
-    if isinstance(owner, FunctionCall):
-        param_scope = function_call_scope(owner, inherited_scopes=tuple(scopes))
-        if param_scope is not None:
-            scopes.append(param_scope)
+    if argument is None:
+        raise ResolutionError("Function call requires an attribute set argument")
+
+    resolved = argument
+    while isinstance(resolved, Parenthesis):
+        resolved = resolved.value
+
+    if isinstance(resolved, Identifier):
+        if scope_chain:
+            set_resolution_context(resolved, scope_chain)
+        resolved = resolved.value
 
-    return tuple(scopes)
+    if isinstance(resolved, AttributeSet):
+        return resolved
+
+    raise ResolutionError("Function call requires an attribute set argument")
 
 
 def function_call_scope(
     call: Any, *, inherited_scopes: tuple[Scope, ...] | None = None
 ) -> Scope | None:
     """Construct a scope for function parameters when applying a call (internal helper; surface may change)."""
-    from nix_manipulator.expressions.binding import Binding  # type: ignore
-    from nix_manipulator.expressions.expression import NixExpression  # type: ignore
-    from nix_manipulator.expressions.function.call import FunctionCall  # type: ignore
-    from nix_manipulator.expressions.function.definition import FunctionDefinition  # type: ignore
-    from nix_manipulator.expressions.identifier import Identifier  # type: ignore
-    from nix_manipulator.expressions.parenthesis import Parenthesis  # type: ignore
-    from nix_manipulator.expressions.set import AttributeSet  # type: ignore
+    from nix_manipulator.expressions.function.call import FunctionCall
 
     if not isinstance(call, FunctionCall):
         return None
+    base_scopes = tuple(inherited_scopes) if inherited_scopes else _call_scopes(call)
+    return _call_parameter_scope(call, base_scopes)
+
+
+def _call_scopes(call: FunctionCall) -> tuple[Scope, ...]:
+    """Collect the scopes a call carries itself when no chain is inherited."""
+    call_scopes: list[Scope] = []
+    if call.scope:
+        call_scopes.append(_as_scope(call.scope, owner=call))
+    call_state = call.scope_state
+    if isinstance(call_state, ScopeState) and call_state.stack:
+        call_scopes.extend(_collect_scopes_from_layers(call_state.stack, owner=call))
+    return tuple(call_scopes)
+
+
+def _call_parameter_scope(
+    call: FunctionCall, base_scopes: tuple[Scope, ...]
+) -> Scope | None:
+    """Bind a call's argument to its function's parameters over *base_scopes*."""
+    from nix_manipulator.expressions.binding import Binding
+    from nix_manipulator.expressions.function.definition import FunctionDefinition
+    from nix_manipulator.expressions.identifier import Identifier
+    from nix_manipulator.expressions.parenthesis import Parenthesis
+
     function_expr = call.name
     if isinstance(function_expr, Parenthesis):
         function_expr = function_expr.value
     if not isinstance(function_expr, FunctionDefinition):
         return None
     parameters = function_expr.argument_set
-    base_scopes: tuple[Scope, ...] = tuple(inherited_scopes or ())
-
-    if not base_scopes:
-        call_state = getattr(call, "scope_state", None)
-        call_scopes: list[Scope] = []
-        if getattr(call, "scope", None) is not None and call.scope:
-            call_scope = _as_scope(getattr(call, "scope"), owner=call)
-            call_scopes.append(call_scope)
-        if call_state is not None and call_state.stack:
-            call_scopes.extend(
-                _collect_scopes_from_layers(
-                    [layer for layer in call_state.stack if layer.get("scope")],
-                    owner=call,
-                )
-            )
-        base_scopes = tuple(call_scopes)
-
-    def _resolve_argument_to_attrset(
-        argument: Any, *, scope_chain: tuple[Scope, ...]
-    ) -> AttributeSet:
-        """Accept identifiers/parentheses that resolve to attrsets."""
-        if argument is None:
-            raise ResolutionError("Function call requires an attribute set argument")
-
-        resolved = argument
-        while isinstance(resolved, Parenthesis):
-            resolved = resolved.value
-
-        if isinstance(resolved, Identifier):
-            if scope_chain:
-                set_resolution_context(resolved, scope_chain)
-            resolved = resolved.value
-
-        if isinstance(resolved, AttributeSet):
-            return resolved
-
-        raise ResolutionError("Function call requires an attribute set argument")
 
     param_scope = Scope(owner=call)
 
@@ -206,17 +242,20 @@ def function_call_scope(
         resolved_argument = _resolve_argument_to_attrset(
             call.argument, scope_chain=base_scopes
         )
-        provided_scope = _as_scope(resolved_argument.values, owner=resolved_argument)
+        # Index the argument once so each parameter is a dict hit rather than
+        # a scan; setdefault keeps the first binding, as get_binding() would.
+        provided: dict[str, Any] = {}
+        for item in resolved_argument.values:
+            if isinstance(item, Binding):
+                provided.setdefault(item.name, item)
 
         for param in params_iterable:
             if not isinstance(param, Identifier):
                 continue
-            try:
-                binding = provided_scope.get_binding(param.name)
+            binding = provided.get(param.name)
+            if binding is not None:
                 param_scope.append(binding)
                 continue
-            except KeyError:
-                pass
 
             default_value = param.default_value
             if default_value is not None:
@@ -238,7 +277,7 @@ def function_call_scope(
     else:
         return None
 
-    scope_chain = tuple(list(base_scopes) + [param_scope])
+    scope_chain = (*base_scopes, param_scope)
     for item in param_scope:
         if isinstance(item, Binding) and isinstance(item.value, NixExpression):
             set_resolution_context(item.value, scope_chain)
@@ -254,16 +293,13 @@ def attach_resolution_context(
     context. If no scopes are available, the expression is returned unchanged.
     """
 
-    scopes: tuple[Scope, ...] | None = None
-    if owner is not None:
-        scopes = scopes_for_owner(owner)
-    else:
-        inherited = _get_context(expr)
-        if inherited is not None:
-            scopes = inherited.scopes
+    if owner is None:
+        # Re-attaching the inherited chain would only replace it with itself.
+        return expr
 
+    scopes = scopes_for_owner(owner)
     if scopes:
-        _store_context(expr, ResolutionContext(scopes=scopes))
+        _store_scopes(expr, scopes)
     return expr
 
 
@@ -273,7 +309,7 @@ def set_resolution_context(expr: NixExpression, scopes: Iterable[Scope]) -> None
     scopes_tuple = tuple(scopes)
     if not scopes_tuple:
         return
-    _store_context(expr, ResolutionContext(scopes=scopes_tuple))
+    _store_scopes(expr, scopes_tuple)
 
 
 def clear_resolution_context(expr: NixExpression) -> None:
@@ -154,6 +154,14 @@ def test_parse_file_accepts_path(tmp_path):
     assert source.rebuild().strip() == "{ a = 1; }"
 
 
+def test_parse_file_non_ascii_uses_text_newlines(tmp_path):
+    """Non-ASCII and CRLF files decode like read_text() before parsing."""
+    file_path = tmp_path / "input.nix"
+    file_path.write_bytes('{\r\n  a = "é";\r\n}\r\n'.encode())
+    source = parser.parse_file(file_path)
+    assert source.rebuild() == '{\n  a = "é";\n}\n'
+
+
 def test_mapping_register_expression_and_unknown_node():
     """Exercise expression registration and unknown node failures."""
 
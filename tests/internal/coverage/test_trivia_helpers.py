@@ -6,8 +6,9 @@ from dataclasses import dataclass, field
 
 import pytest
 
+from nix_manipulator import parse
 from nix_manipulator.expressions.comment import Comment
-from nix_manipulator.expressions.layout import comma, empty_line, linebreak
+from nix_manipulator.expressions.layout import comma, empty_line, linebreak, spaces
 from nix_manipulator.expressions.trivia import (
     Layout,
     _collect_comment_trivia,
@@ -16,14 +17,17 @@ from nix_manipulator.expressions.trivia import (
     _gap_span,
     append_gap_between,
     append_gap_trivia,
+    collect_comments_between_with_gap,
     format_interstitial_trivia,
     format_interstitial_trivia_with_separator,
     format_trivia,
     gap_from_offsets,
     indent_from_gap,
+    node_text,
     parse_delimited_sequence,
     separator_from_layout,
     separator_from_layout_with_comments,
+    source_bytes_context,
 )
 
 
@@ -136,6 +140,17 @@ def test_collect_comment_trivia_appends_empty_line():
     assert empty_line in collected
 
 
+def test_collect_comments_between_with_gap_without_comments():
+    """Return the raw gap directly when no comment nodes are present."""
+    parent = DummyNode(type="root", text=b"a\n\n  b")
+    start = DummyNode(type="start", text=b"a", start_byte=0, end_byte=1)
+    end = DummyNode(type="end", text=b"b", start_byte=5, end_byte=6)
+    assert collect_comments_between_with_gap(parent, [], start, end) == (
+        [],
+        "\n\n  ",
+    )
+
+
 def test_parse_delimited_sequence_trivia_paths():
     """Cover empty-line handling at open/close and inner trivia fallback."""
     parent = DummyNode(
@@ -227,3 +242,30 @@ def test_gap_helpers_and_trivia_appenders():
     end = DummyNode(type="end", start_byte=2, end_byte=3)
     gap = append_gap_between(trivia, parent, start, end)
     assert "\n" in gap
+
+
+def test_node_text_slices_shared_source():
+    """Node text comes from the shared source, honoring its base offset."""
+    node = DummyNode(type="identifier", text=b"b", start_byte=3, end_byte=4)
+    assert node_text(node) == "b"
+    assert node_text(DummyNode(type="identifier")) is None
+
+    with source_bytes_context(b"a = b;", base=1):
+        assert node_text(node) == "="
+    with source_bytes_context("é = b;".encode(), base=0):
+        assert node_text(DummyNode(type="x", start_byte=0, end_byte=2)) == "é"
+
+
+def test_spaces_shares_common_widths():
+    """Common indent widths reuse one string; others fall back to multiplying."""
+    assert spaces(4) == "    "
+    assert spaces(4) is spaces(4)
+    assert spaces(0) == ""
+    assert spaces(-2) == ""
+    assert spaces(200) == " " * 200
+
+
+def test_gaps_use_source_base_offset():
+    """Leading whitespace before the root node must not shift gap offsets."""
+    source = "{\n  a = 1;\n\n  b = 2;\n}\n"
+    assert parse("  \n\n" + source).rebuild() == source
@@ -175,7 +175,8 @@ with { a = 1; };
 with { a = 1; };
 {
   foo = 2;
-}""".strip("\n")
+}
+""".lstrip("\n")
     )
 
 
@@ -192,7 +193,7 @@ body
         == """
 with { body = { foo = 3; }; };
 body
-""".strip("\n")
+""".lstrip("\n")
     )
 
 
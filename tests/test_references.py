@@ -13,7 +13,7 @@ from nix_manipulator.expressions.identifier import Identifier
 from nix_manipulator.expressions.inherit import Inherit
 from nix_manipulator.expressions.parenthesis import Parenthesis
 from nix_manipulator.expressions.primitive import Primitive
-from nix_manipulator.expressions.scope import Scope
+from nix_manipulator.expressions.scope import Scope, ScopeState
 from nix_manipulator.expressions.set import AttributeSet
 from nix_manipulator.expressions.with_statement import WithStatement
 from nix_manipulator.resolution import (
@@ -211,6 +211,16 @@ def test_scopes_for_owner_include_inherited_context():
     assert len(context.scopes) == 3
 
 
+def test_scopes_for_owner_normalizes_dict_scope_state():
+    """Dict scope_state assigned after construction must still expose its stack."""
+    owner = Identifier("owner")
+    owner.scope_state = {"stack": [{"scope": [Binding(name="stacked", value=3)]}]}
+
+    (stacked_scope,) = scopes_for_owner(owner)
+    assert stacked_scope.get_binding("stacked").value == 3
+    assert isinstance(owner.scope_state, ScopeState)
+
+
 def test_empty_resolution_context_is_ignored():
     """An empty context should not be stored on the identifier."""
     ident = nix("none").expr
@@ -415,6 +425,15 @@ def test_function_call_scope_accepts_parenthesized_attrset_argument():
     assert scope.get_binding("x").value == 2
 
 
+def test_scope_get_binding_returns_default_for_missing_names():
+    """A default should be returned instead of raising for missing bindings."""
+    scope = Scope([Binding(name="x", value=1)])
+    assert scope.get_binding("y", None) is None
+    assert scope.get_binding("x", None) is scope[0]
+    with pytest.raises(KeyError):
+        scope.get_binding("y")
+
+
 def test_function_call_scope_uses_scope_stack_for_identifier_argument():
     """Scope stacks on the call should provide context for identifier arguments."""
     binding = Binding(name="args", value=AttributeSet({"x": 1}))